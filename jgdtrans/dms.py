@@ -16,9 +16,16 @@ if TYPE_CHECKING:
         from typing_extensions import Self
 
 
+try:
+    import numpy as _np
+except ImportError:  # no cov
+    _np = None  # type: ignore[assignment]
+
 __all__ = [
     "to_dms",
     "from_dms",
+    "from_dd_bulk",
+    "to_dd_bulk",
     "DMS",
 ]
 
@@ -65,6 +72,89 @@ def from_dms(s: str) -> float:
     return DMS.from_str(s).to_dd()
 
 
+def from_dd_bulk(t) -> tuple[_np.ndarray, _np.ndarray, _np.ndarray, _np.ndarray, _np.ndarray]:
+    """Converts DD notation :obj:`float` to DMS components, whole arrays at once (requires :mod:`numpy`).
+
+    This is the batch counterpart of :meth:`DMS.from_dd`,
+    returning component arrays instead of :class:`DMS` objs;
+    the components equal :meth:`DMS.from_dd` of each element bitwise.
+
+    Args:
+        t: the DD notation latitudes and/or longitudes,
+           each satisfies -180.0 <= and <= 180.0
+
+    Returns:
+        the sign, the degree, the minute and the second (:obj:`numpy.int64` arrays),
+        and the fraction part of second (:obj:`numpy.float64` array)
+
+    Raises:
+        ImportError: when numpy is not installed
+        ValueError: when `t` has an out-of-range element
+
+    Examples:
+        >>> from_dd_bulk([36.103774791666666, -140.08785504166667])
+        (array([ 1, -1]), array([ 36, 140]), array([6, 5]), array([13, 16]),
+         array([0.58925, 0.27815]))
+    """
+    if _np is None:
+        raise ImportError("from_dd_bulk requires numpy, consider installing 'jgdtrans[numpy]'")
+
+    t = _np.ascontiguousarray(t, dtype=_np.float64)
+
+    invalid = ~((-180 <= t) & (t <= 180))
+    if invalid.any():
+        raise ValueError(f"expected t is -180.0 <= and <= 180.0, we got {float(t[invalid][0])}")
+
+    mm = _np.modf(t)[0] * 60
+    ss = _np.modf(mm)[0] * 60
+
+    sign = _np.where(0 <= t, 1, -1)
+    degree = _np.abs(_np.trunc(t)).astype(_np.int64)
+    minute = _np.abs(_np.trunc(mm)).astype(_np.int64)
+    second = _np.abs(_np.trunc(ss)).astype(_np.int64)
+    fract = _np.abs(_np.modf(ss)[0])
+
+    # mirrors DMS._carry
+    carry, second = _np.divmod(second, 60)
+    carry, minute = _np.divmod(minute + carry, 60)
+
+    return sign, degree + carry, minute, second, fract
+
+
+def to_dd_bulk(sign, degree, minute, second, fract) -> _np.ndarray:
+    """Converts DMS components to DD notation, whole arrays at once (requires :mod:`numpy`).
+
+    This is the batch counterpart of :meth:`DMS.to_dd`,
+    the result equals :meth:`DMS.to_dd` of each component row bitwise.
+
+    Args:
+        sign: the signs of latitudes and/or longitudes, 1 or -1
+        degree: the degrees
+        minute: the minutes
+        second: the integer parts of seconds
+        fract: the fraction parts of seconds
+
+    Returns:
+        the DD notation latitudes and/or longitudes (:obj:`numpy.float64` array)
+
+    Raises:
+        ImportError: when numpy is not installed
+
+    Examples:
+        >>> to_dd_bulk([1, -1], [36, 140], [6, 5], [13, 16], [0.58925, 0.27815])
+        array([  36.10377479, -140.08785504])
+    """
+    if _np is None:
+        raise ImportError("to_dd_bulk requires numpy, consider installing 'jgdtrans[numpy]'")
+
+    degree = _np.asarray(degree, dtype=_np.float64)
+    minute = _np.asarray(minute, dtype=_np.float64)
+    second = _np.asarray(second, dtype=_np.float64)
+    fract = _np.asarray(fract, dtype=_np.float64)
+
+    return _np.copysign(degree + minute / 60 + (second + fract) / 3600, _np.asarray(sign, dtype=_np.float64))
+
+
 @dataclass(frozen=True)
 class DMS:
     """Represents latitude and/or longitude in DMS notation.
@@ -92,6 +182,8 @@ class DMS:
         DMS(sign=1, degree=36, minute=6, second=13, fract=0.58925)
     """
 
+    __slots__ = ("sign", "degree", "minute", "second", "fract")
+
     sign: Literal[1, -1]
     """The sign of latitude or longitude."""
     degree: int
@@ -117,6 +209,15 @@ class DMS:
         elif self.degree == 180.0 and (self.minute != 0 or self.second != 0 or self.fract != 0):
             raise ValueError(f"invalid value given, we got {self.degree}, {self.minute}, {self.second}, {self.fract}")
 
+    def __getstate__(self):
+        # frozen dataclass with manual __slots__,
+        # the default pickle/deepcopy restore path raises FrozenInstanceError
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     @staticmethod
     def _carry(sign: Literal[1, -1], degree: int, minute: int, second: int, fract: float):
         carry, second = divmod(second, 60)
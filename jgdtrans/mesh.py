@@ -12,8 +12,8 @@ in general.
 
 from __future__ import annotations
 
-import ctypes
 import math
+import struct
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import TYPE_CHECKING
@@ -30,6 +30,11 @@ if TYPE_CHECKING:
 
 from . import point as _point
 
+try:
+    import numpy as _np
+except ImportError:  # no cov
+    _np = None  # type: ignore[assignment]
+
 __all__ = [
     "MESH_COORD_MIN",
     "MESH_COORD_MAX",
@@ -99,6 +104,61 @@ def is_meshcode(meshcode: int) -> bool:
         return True
 
 
+_VALID_UNITS: Final = frozenset((1, 5))
+
+# the degree contributions of the second and the third digit;
+# built by the very division they replace, hence bitwise identical to it
+_SECOND_DEGREE: Final = tuple(second / 8 for second in range(8))
+_THIRD_DEGREE: Final = tuple(third / 80 for third in range(10))
+
+_F64_PACK: Final = struct.Struct("<d").pack
+_F64_TO_U64: Final = struct.Struct("<Q").unpack
+
+
+def _from_degree(degree: float) -> tuple[int, int, int]:
+    """Computes the digit triplet of :class:`MeshCoord` from `degree`.
+
+    The callers guarantee 0.0 <= `degree`, hence truncation equals flooring.
+    """
+    integer = int(degree)
+
+    first = integer % 100
+    second = int(8 * degree) - 8 * integer
+    third = int(80 * degree) - 80 * integer - 10 * second
+
+    return first, second, third
+
+
+def _from_degree_array(degree, mesh_unit):
+    """Vectorized version of :meth:`MeshCoord._from_degree` (`degree` is a :obj:`numpy.ndarray`).
+
+    The callers guarantee 0.0 <= `degree`, hence truncation equals flooring.
+    """
+    integer = degree.astype(_np.int32)
+
+    first = integer % 100
+    second = (8 * degree).astype(_np.int32) - 8 * integer
+    third = (80 * degree).astype(_np.int32) - 80 * integer - 10 * second
+
+    if mesh_unit == 5:
+        third = _np.where(third < 5, 0, 5)
+
+    return first.astype(_np.int8), second.astype(_np.int8), third.astype(_np.int8)
+
+
+def _next_up_array(first, second, third, mesh_unit):
+    """Vectorized version of :meth:`MeshCoord.next_up` on the digit arrays."""
+    key = (first.astype(_np.int32) * 8 + second) * 10 + third + mesh_unit
+
+    if _np.any(7999 < key):
+        raise OverflowError(f"unable to add {mesh_unit} to MeshCoord(first=99, second=7, third=9)")
+
+    first, rest = _np.divmod(key, 80)
+    second, third = _np.divmod(rest, 10)
+
+    return first.astype(_np.int8), second.astype(_np.int8), third.astype(_np.int8)
+
+
 class MeshUnit(IntEnum):
     """The mesh unit, or approximate length of cell's edge."""
 
@@ -108,6 +168,14 @@ class MeshUnit(IntEnum):
     """5 [km]"""
 
 
+# the interning table of MeshCoord, it has at most 100 x 8 x 10 = 8000 entries.
+# Only _new_unchecked() interns (it covers the hot construction paths);
+# the public constructor always builds a fresh obj so that instances
+# made from exotic digit types (numpy integers etc.) never alias into
+# a shared one
+_COORD_CACHE: Final[dict[tuple[int, int, int], MeshCoord]] = {}
+
+
 @dataclass(frozen=True)
 class MeshCoord:
     """Represents mesh coordinate, namely, discrete latitude and/or longitude.
@@ -155,6 +223,8 @@ class MeshCoord:
         MeshCoord(first=54, second=1, third=1)
     """
 
+    __slots__ = ("first", "second", "third", "_key", "_degree", "_latitude")
+
     first: int
     """takes values 0, ..., 99."""
     second: int
@@ -163,72 +233,90 @@ class MeshCoord:
     """takes values 0, ..., 9."""
 
     def __post_init__(self):
-        if not (0 <= self.first <= 99):
-            raise ValueError(f"expected first is 0 to 9, we got {self.first}") from None
-        elif not (0 <= self.second <= 7):
-            raise ValueError(f"expected second is 0 to 7, we got {self.second}") from None
-        elif not (0 <= self.third <= 9):
-            raise ValueError(f"expected second is 0 to 9, we got {self.third}") from None
+        first, second, third = self.first, self.second, self.third
+
+        # the fast path, the diagnosis is done on failure only
+        if 0 <= first <= 99 and 0 <= second <= 7 and 0 <= third <= 9:
+            # the packed key which preserves the lexicographic order,
+            # makes the comparisons a single int comparison;
+            # int() keeps the key exact for narrow digits such as numpy.int8
+            object.__setattr__(self, "_key", (int(first) * 8 + int(second)) * 10 + int(third))
+            return
+
+        if not (0 <= first <= 99):
+            raise ValueError(f"expected first is 0 to 9, we got {first}")
+        elif not (0 <= second <= 7):
+            raise ValueError(f"expected second is 0 to 7, we got {second}")
+        raise ValueError(f"expected second is 0 to 9, we got {third}")
 
     def __lt__(self, other: Self) -> bool:
         if not isinstance(other, MeshCoord):
             raise TypeError(
                 f"'<' not supported between instances of '{type(self).__name__}' and '{type(self).__name__}'"
-            ) from None
+            )
 
-        if self.first == other.first:
-            if self.second == other.second:
-                return self.third < other.third
-            return self.second < other.second
-        return self.first < other.first
+        return self._key < other._key
 
     def __le__(self, other: Self) -> bool:
         if not isinstance(other, MeshCoord):
             raise TypeError(
                 f"'<=' not supported between instances of '{type(self).__name__}' and '{type(self).__name__}'"
-            ) from None
+            )
 
-        if self.first == other.first:
-            if self.second == other.second:
-                return self.third <= other.third
-            return self.second < other.second
-        return self.first < other.first
+        return self._key <= other._key
 
     def __gt__(self, other: Self) -> bool:
         if not isinstance(other, MeshCoord):
             raise TypeError(
                 f"'>' not supported between instances of '{type(self).__name__}' and '{type(self).__name__}'"
-            ) from None
+            )
 
-        if self.first == other.first:
-            if self.second == other.second:
-                return self.third > other.third
-            return self.second > other.second
-        return self.first > other.first
+        return self._key > other._key
 
     def __ge__(self, other: Self) -> bool:
         if not isinstance(other, MeshCoord):
             raise TypeError(
                 f"'>=' not supported between instances of '{type(self).__name__}' and '{type(self).__name__}'"
-            ) from None
+            )
 
-        if self.first == other.first:
-            if self.second == other.second:
-                return self.third >= other.third
-            return self.second > other.second
-        return self.first > other.first
+        return self._key >= other._key
+
+    def __getstate__(self):
+        # the manual __slots__ defeats the default pickle/deepcopy machinery
+        # on frozen dataclasses, hand the slots over explicitly;
+        # hasattr() skips the lazily-filled caches
+        return {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     @classmethod
-    def _from_degree(cls, degree: float, mesh_unit: _types.MeshUnitType) -> Self:
-        integer = math.floor(degree)
+    def _new_unchecked(cls, first: int, second: int, third: int) -> Self:
+        """Makes a :class:`MeshCoord` obj skipping the validation.
 
-        first = integer % 100
-        second = math.floor(8 * degree) - 8 * integer
-        third = math.floor(80 * degree) - 80 * integer - 10 * second
+        The digits must be in-range, the caller is responsible for that.
+        """
+        key = (first, second, third)
+        cached = _COORD_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        self = object.__new__(cls)
+        object.__setattr__(self, "first", first)
+        object.__setattr__(self, "second", second)
+        object.__setattr__(self, "third", third)
+        object.__setattr__(self, "_key", (first * 8 + second) * 10 + third)
+        _COORD_CACHE[key] = self
+        return self
+
+    @classmethod
+    def _from_degree(cls, degree: float, mesh_unit: _types.MeshUnitType) -> Self:
+        first, second, third = _from_degree(degree)
 
         if mesh_unit == 1:
-            return cls(first, second, third)
-        return cls(first, second, 0 if third < 5 else 5)
+            return cls._new_unchecked(first, second, third)
+        return cls._new_unchecked(first, second, 0 if third < 5 else 5)
 
     @classmethod
     def from_latitude(cls, degree: float, mesh_unit: _types.MeshUnitType) -> Self:
@@ -256,16 +344,16 @@ class MeshCoord:
         # Minimum add-hook trick to ensure the identity,
         # 1. MeshCoord.from_latitude(coord.to_latitude(), 1)
         # 2. MeshCoord.from_longitude(coord.to_longitude(), 1)
-        if mesh_unit not in (1, 5):
-            raise TypeError(f"expected mesh unit is 1 or 5, we got {mesh_unit}") from None
+        if mesh_unit not in _VALID_UNITS:
+            raise TypeError(f"expected mesh unit is 1 or 5, we got {mesh_unit}")
 
         d = 3 * degree / 2
         # float to int trick
-        if ctypes.c_uint64.from_buffer(ctypes.c_double(degree)).value % 2 == 1:
+        if _F64_TO_U64(_F64_PACK(degree))[0] & 1:
             d = math.nextafter(d, math.inf)
 
         if not (0 <= d < 100):
-            raise ValueError(f"expected 0.0 <= value and value < 66.666..., we got {degree}") from None
+            raise ValueError(f"expected 0.0 <= value and value < 66.666..., we got {degree}")
 
         return cls._from_degree(d, mesh_unit=mesh_unit)
 
@@ -292,13 +380,100 @@ class MeshCoord:
         See Also:
             - :meth:`MeshCoord.to_longitude`
         """
-        if mesh_unit not in (1, 5):
-            raise TypeError(f"expected mesh unit is 1 or 5, we got {mesh_unit}") from None
+        if mesh_unit not in _VALID_UNITS:
+            raise TypeError(f"expected mesh unit is 1 or 5, we got {mesh_unit}")
         elif not (100 <= degree <= 180):
-            raise ValueError(f"expected 100.0 <= value and value <= 180.0, we got {degree}") from None
+            raise ValueError(f"expected 100.0 <= value and value <= 180.0, we got {degree}")
 
         return cls._from_degree(degree, mesh_unit=mesh_unit)
 
+    @classmethod
+    def from_latitudes(cls, degrees, mesh_unit: _types.MeshUnitType):
+        """Batch version of :meth:`MeshCoord.from_latitude` on a :obj:`numpy.ndarray`.
+
+        This requires :mod:`numpy` (optional dependency).
+
+        This skips the per-element :class:`MeshCoord` construction,
+        and returns SoA-layout arrays of the digits instead
+        for the sake of the bulk consumers (e.g. grid conversion).
+
+        Args:
+            degrees: the latitudes [deg] which satisfy 0.0 <= and <= 66.666...
+            mesh_unit: the mesh unit, :obj:`1` or :obj:`5`
+
+        Returns:
+            a triplet of the `first`, the `second` and the `third` digits
+            (:obj:`numpy.int8` arrays)
+
+        Raises:
+            ValueError: if any element of `degrees` is out-of-range
+
+        Examples:
+            >>> MeshCoord.from_latitudes(np.asarray([36.103774791666666]), 1)
+            (array([54], dtype=int8), array([1], dtype=int8), array([2], dtype=int8))
+
+        See Also:
+            - :meth:`MeshCoord.from_latitude`
+        """
+        if _np is None:  # no cov
+            raise ImportError("from_latitudes requires numpy, consider installing 'jgdtrans[numpy]'")
+        if mesh_unit not in _VALID_UNITS:
+            raise TypeError(f"expected mesh unit is 1 or 5, we got {mesh_unit}")
+
+        degrees = _np.ascontiguousarray(degrees, dtype=_np.float64)
+
+        d = 3 * degrees / 2
+        # float to int trick, see MeshCoord.from_latitude
+        mask = degrees.view(_np.uint64) % 2 == 1
+        d[mask] = _np.nextafter(d[mask], _np.inf)
+
+        # the complement form rejects nan too, as from_latitude does
+        if _np.any(~((0 <= d) & (d < 100))):
+            raise ValueError("expected 0.0 <= value and value < 66.666... for all elements")
+
+        return _from_degree_array(d, mesh_unit=mesh_unit)
+
+    @classmethod
+    def from_longitudes(cls, degrees, mesh_unit: _types.MeshUnitType):
+        """Batch version of :meth:`MeshCoord.from_longitude` on a :obj:`numpy.ndarray`.
+
+        This requires :mod:`numpy` (optional dependency).
+
+        This skips the per-element :class:`MeshCoord` construction,
+        and returns SoA-layout arrays of the digits instead
+        for the sake of the bulk consumers (e.g. grid conversion).
+
+        Args:
+            degrees: the longitudes [deg] which satisfy 100.0 <= and <= 180.0
+            mesh_unit: the mesh unit, :obj:`1` or :obj:`5`
+
+        Returns:
+            a triplet of the `first`, the `second` and the `third` digits
+            (:obj:`numpy.int8` arrays)
+
+        Raises:
+            ValueError: if any element of `degrees` is out-of-range
+
+        Examples:
+            >>> MeshCoord.from_longitudes(np.asarray([140.08785504166664]), 1)
+            (array([40], dtype=int8), array([0], dtype=int8), array([7], dtype=int8))
+
+        See Also:
+            - :meth:`MeshCoord.from_longitude`
+        """
+        if _np is None:  # no cov
+            raise ImportError("from_longitudes requires numpy, consider installing 'jgdtrans[numpy]'")
+        if mesh_unit not in _VALID_UNITS:
+            raise TypeError(f"expected mesh unit is 1 or 5, we got {mesh_unit}")
+
+        degrees = _np.ascontiguousarray(degrees, dtype=_np.float64)
+
+        # the complement form rejects nan too, as from_longitude does
+        if _np.any(~((100 <= degrees) & (degrees <= 180))):
+            raise ValueError("expected 100.0 <= value and value <= 180.0 for all elements")
+
+        return _from_degree_array(degrees, mesh_unit=mesh_unit)
+
     def is_mesh_unit(self, mesh_unit: _types.MeshUnitType) -> bool:
         """Returns :obj:`True` when `self` is compatible to the `unit`.
 
@@ -316,12 +491,21 @@ class MeshCoord:
             >>> MeshCoord(1, 2, 3).is_mesh_unit(5)
             False
         """
-        if mesh_unit not in (1, 5):
-            raise TypeError(f"expected mesh unit is 1 or 5, we got {mesh_unit}") from None
-        return self.third % mesh_unit == 0
+        # every third digit is compatible to the mesh unit 1
+        if mesh_unit == 1:
+            return True
+        elif mesh_unit == 5:
+            return self.third % 5 == 0
+        raise TypeError(f"expected mesh unit is 1 or 5, we got {mesh_unit}")
 
     def _to_degree(self) -> float:
-        return self.first + self.second / 8 + self.third / 80
+        # instances are interned, hence the cache pays off across cells
+        try:
+            return self._degree
+        except AttributeError:
+            degree = self.first + _SECOND_DEGREE[self.second] + _THIRD_DEGREE[self.third]
+            object.__setattr__(self, "_degree", degree)
+            return degree
 
     def to_latitude(self) -> float:
         """Returns the latitude that `self` converts into.
@@ -341,7 +525,12 @@ class MeshCoord:
         See Also:
             - :meth:`MeshCoord.from_latitude`
         """
-        return 2 * self._to_degree() / 3
+        try:
+            return self._latitude
+        except AttributeError:
+            latitude = 2 * self._to_degree() / 3
+            object.__setattr__(self, "_latitude", latitude)
+            return latitude
 
     def to_longitude(self) -> float:
         """Returns the longitude that `self` converts into.
@@ -390,19 +579,16 @@ class MeshCoord:
         if not self.is_mesh_unit(mesh_unit):
             raise ValueError(
                 f"expected mesh unit is 1 when third is neither 0 nor 5, we got {mesh_unit} (third is {self.third})"
-            ) from None
+            )
 
-        # that is self.THIRD_MAX - self.unit
-        bound: Final = 9 if mesh_unit == 1 else 5
+        # increment with carry on the packed key
+        key = self._key + mesh_unit
+        if 7999 < key:
+            raise OverflowError(f"unable to add {mesh_unit} to {self}")
 
-        # increment
-        if self.third == bound:
-            if self.second == MESH_COORD_MAX.second:
-                if self.first == MESH_COORD_MAX.first:
-                    raise OverflowError(f"unable to add {mesh_unit} to {self}") from None
-                return MeshCoord(self.first + 1, MESH_COORD_MIN.second, MESH_COORD_MIN.third)
-            return MeshCoord(self.first, self.second + 1, MESH_COORD_MIN.third)
-        return MeshCoord(self.first, self.second, self.third + mesh_unit)
+        first, rest = divmod(key, 80)
+        second, third = divmod(rest, 10)
+        return MeshCoord._new_unchecked(first, second, third)
 
     def next_down(self, mesh_unit: _types.MeshUnitType) -> MeshCoord:
         """Returns the greatest :class:`MeshCoord` obj less than `self`.
@@ -431,18 +617,16 @@ class MeshCoord:
         if not self.is_mesh_unit(mesh_unit):
             raise ValueError(
                 f"expected mesh unit is 1 when third is neither 0 nor 5, we got {mesh_unit} (third is {self.third})"
-            ) from None
+            )
 
-        # that is self.THIRD_MAX - self.unit
-        bound: Final = 9 if mesh_unit == 1 else 5
+        # decrement with borrow on the packed key
+        key = self._key - mesh_unit
+        if key < 0:
+            raise OverflowError(f"unable to subtract {mesh_unit} from {self}")
 
-        if self.third == MESH_COORD_MIN.third:
-            if self.second == MESH_COORD_MIN.second:
-                if self.first == MESH_COORD_MIN.first:
-                    raise OverflowError(f"unable to subtract {mesh_unit} from {self}") from None
-                return MeshCoord(self.first - 1, MESH_COORD_MAX.second, bound)
-            return MeshCoord(self.first, self.second - 1, bound)
-        return MeshCoord(self.first, self.second, self.third - mesh_unit)
+        first, rest = divmod(key, 80)
+        second, third = divmod(rest, 10)
+        return MeshCoord._new_unchecked(first, second, third)
 
 
 @dataclass(frozen=True)
@@ -473,6 +657,8 @@ class MeshNode:
         MeshNode(latitude=MeshCoord(54, 1, 2), longitude=MeshCoord(40, 0, 7))
     """
 
+    __slots__ = ("latitude", "longitude", "_meshcode")
+
     latitude: MeshCoord
     """The mesh coord of latitude."""
     longitude: MeshCoord
@@ -482,10 +668,28 @@ class MeshNode:
     """
 
     def __post_init__(self):
-        if MeshCoord(80, 0, 0) < self.longitude:
+        # 6400 is the key of MeshCoord(80, 0, 0)
+        if 6400 < self.longitude._key:
             raise ValueError(
                 f"expected latitude is less than or equal MeshCoord(80, 0, 0), we got {self.longitude}"
-            ) from None
+            )
+
+        # cache the meshcode, to_meshcode is on the parameter-lookup hot path
+        object.__setattr__(
+            self,
+            "_meshcode",
+            (self.latitude.first * 100 + self.longitude.first) * 10_000
+            + (self.latitude.second * 10 + self.longitude.second) * 100
+            + (self.latitude.third * 10 + self.longitude.third),
+        )
+
+    # pickle/deepcopy support, see MeshCoord
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     def is_mesh_unit(self, mesh_unit: _types.MeshUnitType) -> bool:
         """Returns :obj:`True` when `self` is compatible to the `unit`.
@@ -547,6 +751,91 @@ class MeshNode:
         except ValueError as exc:
             raise ValueError(f"invalid meshcode, we got {meshcode}") from exc
 
+    @classmethod
+    def from_meshcodes(cls, meshcodes):
+        """Batch version of :meth:`MeshNode.from_meshcode` on a :obj:`numpy.ndarray`.
+
+        This requires :mod:`numpy` (optional dependency).
+
+        This returns SoA-layout digit arrays instead of :class:`MeshNode` objs.
+
+        Args:
+            meshcodes: the meshcodes
+
+        Returns:
+            a sextuplet of the latitude digits and the longitude digits
+            (:obj:`numpy.int8` arrays)
+
+        Raises:
+            ValueError: when any meshcode is invalid
+
+        See Also:
+            - :meth:`MeshNode.from_meshcode`
+            - :meth:`MeshNode.to_meshcodes`
+        """
+        if _np is None:  # no cov
+            raise ImportError("from_meshcodes requires numpy, consider installing 'jgdtrans[numpy]'")
+
+        meshcodes = _np.asarray(meshcodes, dtype=_np.int64)
+        if _np.any((meshcodes < 0) | (10000_00_00 <= meshcodes)):
+            raise ValueError("too large meshcode found")
+
+        lat_first, rest = _np.divmod(meshcodes, 100_00_00)
+        lng_first, rest = _np.divmod(rest, 100_00)
+
+        lat_second, rest = _np.divmod(rest, 10_00)
+        lng_second, rest = _np.divmod(rest, 100)
+
+        lat_third, lng_third = _np.divmod(rest, 10)
+
+        # the second digits and the longitude bound, see MeshCoord and MeshNode
+        if _np.any(7 < lat_second) or _np.any(7 < lng_second):
+            raise ValueError("invalid meshcode found")
+        elif _np.any(6400 < (lng_first * 8 + lng_second) * 10 + lng_third):
+            raise ValueError("invalid meshcode found")
+
+        return (
+            lat_first.astype(_np.int8),
+            lat_second.astype(_np.int8),
+            lat_third.astype(_np.int8),
+            lng_first.astype(_np.int8),
+            lng_second.astype(_np.int8),
+            lng_third.astype(_np.int8),
+        )
+
+    @classmethod
+    def to_meshcodes(cls, lat_first, lat_second, lat_third, lng_first, lng_second, lng_third):
+        """Batch version of :meth:`MeshNode.to_meshcode` on SoA digit arrays.
+
+        This requires :mod:`numpy` (optional dependency).
+
+        This does not validate the digits,
+        give the result of the batch API (e.g. :meth:`MeshNode.from_pos_array`).
+
+        Args:
+            lat_first: the first digits of latitude
+            lat_second: the second digits of latitude
+            lat_third: the third digits of latitude
+            lng_first: the first digits of longitude
+            lng_second: the second digits of longitude
+            lng_third: the third digits of longitude
+
+        Returns:
+            the meshcodes (a :obj:`numpy.int64` array)
+
+        See Also:
+            - :meth:`MeshNode.to_meshcode`
+            - :meth:`MeshNode.from_meshcodes`
+        """
+        if _np is None:  # no cov
+            raise ImportError("to_meshcodes requires numpy, consider installing 'jgdtrans[numpy]'")
+
+        return (
+            (lat_first.astype(_np.int64) * 100 + lng_first) * 10_000
+            + (lat_second.astype(_np.int64) * 10 + lng_second) * 100
+            + (lat_third.astype(_np.int64) * 10 + lng_third)
+        )
+
     @classmethod
     def from_point(cls, point: _point.Point, mesh_unit: _types.MeshUnitType) -> Self:
         """Makes the nearest north-west :class:`MeshNode` of `point`.
@@ -608,6 +897,36 @@ class MeshNode:
             MeshCoord.from_longitude(longitude, mesh_unit=mesh_unit),
         )
 
+    @classmethod
+    def from_pos_array(cls, latitudes, longitudes, mesh_unit: _types.MeshUnitType):
+        """Batch version of :meth:`MeshNode.from_pos` on :obj:`numpy.ndarray` objs.
+
+        This requires :mod:`numpy` (optional dependency).
+
+        This returns SoA-layout digit arrays instead of :class:`MeshNode` objs,
+        and does not verify the longitude is less than or equal :code:`MeshCoord(80, 0, 0)`.
+
+        Args:
+            latitudes: the latitudes [deg] which satisfy 0.0 <= and <= 66.666...
+            longitudes: the longitudes [deg] which satisfy 100.0 <= and <= 180.0
+            mesh_unit: the mesh unit, :obj:`1` or :obj:`5`
+
+        Returns:
+            a sextuplet of the latitude digits and the longitude digits
+            (:obj:`numpy.int8` arrays)
+
+        Raises:
+            ValueError: if any element of `latitudes` or `longitudes` is out-of-range
+
+        See Also:
+            - :meth:`MeshNode.from_pos`
+            - :meth:`MeshCoord.from_latitudes`
+            - :meth:`MeshCoord.from_longitudes`
+        """
+        return MeshCoord.from_latitudes(latitudes, mesh_unit=mesh_unit) + MeshCoord.from_longitudes(
+            longitudes, mesh_unit=mesh_unit
+        )
+
     def to_meshcode(self) -> int:
         """Returns a meshcode represents `self`.
 
@@ -626,11 +945,7 @@ class MeshNode:
         See Also:
             - :meth:`MeshNode.from_meshcode`
         """
-        return (
-            (self.latitude.first * 100 + self.longitude.first) * 10_000
-            + (self.latitude.second * 10 + self.longitude.second) * 100
-            + (self.latitude.third * 10 + self.longitude.third)
-        )
+        return self._meshcode
 
     def to_point(self) -> _point.Point:
         """Returns a :class:`.Point` (latitude and longitude) where `self` locates.
@@ -720,6 +1035,18 @@ class MeshCell:
         (0.4529748000001632, 0.028403280000475206)
     """
 
+    __slots__ = (
+        "south_west",
+        "south_east",
+        "north_west",
+        "north_east",
+        "mesh_unit",
+        "_sw_latitude",
+        "_sw_longitude",
+        "_k_latitude",
+        "_k_longitude",
+    )
+
     south_west: MeshNode
     """The south-west node of the cell."""
     south_east: MeshNode
@@ -732,44 +1059,57 @@ class MeshCell:
     """The mesh unit, :obj:`1` or :obj:`5`."""
 
     def __post_init__(self):
-        if not self.south_west.is_mesh_unit(self.mesh_unit):
-            raise ValueError(
-                f"expected mesh unit is 1 when third is neither 0 nor 5, "
-                f"we got a mesh node (south-west) as {self.south_west}"
-            ) from None
-        elif not self.south_east.is_mesh_unit(self.mesh_unit):
-            raise ValueError(
-                f"expected mesh unit is 1 when third is neither 0 nor 5, "
-                f"we got a mesh node (south-east) as {self.south_east}"
-            ) from None
-        elif not self.north_west.is_mesh_unit(self.mesh_unit):
-            raise ValueError(
-                f"expected mesh unit is 1 when third is neither 0 nor 5, "
-                f"we got a mesh node (north-west) as {self.north_west}"
-            ) from None
-        elif not self.north_east.is_mesh_unit(self.mesh_unit):
-            raise ValueError(
-                f"expected mesh unit is 1 when third is neither 0 nor 5, "
-                f"we got a mesh node (north-east) as {self.north_east}"
-            ) from None
-
+        if self.mesh_unit not in _VALID_UNITS:
+            raise TypeError(f"expected mesh unit is 1 or 5, we got {self.mesh_unit}")
+
+        if self.mesh_unit == 5:
+            for name, node in (
+                ("south-west", self.south_west),
+                ("south-east", self.south_east),
+                ("north-west", self.north_west),
+                ("north-east", self.north_east),
+            ):
+                if node.latitude.third % 5 or node.longitude.third % 5:
+                    raise ValueError(
+                        f"expected mesh unit is 1 when third is neither 0 nor 5, "
+                        f"we got a mesh node ({name}) as {node}"
+                    )
+
+        # compare fields directly, constructing a throwaway MeshNode is not necessary
         next_lat = self.south_west.latitude.next_up(self.mesh_unit)
         next_lng = self.south_west.longitude.next_up(self.mesh_unit)
-        if not MeshNode(next_lat, self.south_west.longitude) == self.north_west:
+        if next_lat != self.north_west.latitude or self.south_west.longitude != self.north_west.longitude:
             raise ValueError(
                 f"inconsistent on south-west vs north-west with mesh unit {self.mesh_unit}, "
                 f"we got south-west {self.south_west} and nw {self.north_west}"
-            ) from None
-        elif not MeshNode(self.south_west.latitude, next_lng) == self.south_east:
+            )
+        elif self.south_west.latitude != self.south_east.latitude or next_lng != self.south_east.longitude:
             raise ValueError(
                 f"inconsistent on south-west vs south-east with mesh unit {self.mesh_unit}, "
                 f"we got south-west {self.south_west} and se {self.south_east}"
-            ) from None
-        elif not MeshNode(next_lat, next_lng) == self.north_east:
+            )
+        elif next_lat != self.north_east.latitude or next_lng != self.north_east.longitude:
             raise ValueError(
                 f"inconsistent on south-west vs south-east with mesh unit {self.mesh_unit}, "
                 f"we got south-west {self.south_west} and ne {self.north_east}"
-            ) from None
+            )
+
+        # cache the origin and the scales which position() applies per call.
+        # The cell stretches 1.5 times in the latitude direction
+        # compared to the longitude direction,
+        # then here uses 120 = 1.5 * 80.
+        object.__setattr__(self, "_sw_latitude", self.south_west.latitude.to_latitude())
+        object.__setattr__(self, "_sw_longitude", self.south_west.longitude.to_longitude())
+        object.__setattr__(self, "_k_latitude", 120 if self.mesh_unit == 1 else 24)
+        object.__setattr__(self, "_k_longitude", 80 if self.mesh_unit == 1 else 16)
+
+    # pickle/deepcopy support, see MeshCoord
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     @classmethod
     def from_meshcode(cls, meshcode: int, mesh_unit: _types.MeshUnitType) -> Self:
@@ -932,6 +1272,46 @@ class MeshCell:
             mesh_unit=mesh_unit,
         )
 
+    @classmethod
+    def from_pos_array(cls, latitudes, longitudes, mesh_unit: _types.MeshUnitType):
+        """Batch version of :meth:`MeshCell.from_pos` on :obj:`numpy.ndarray` objs.
+
+        This requires :mod:`numpy` (optional dependency).
+
+        This returns SoA-layout digit arrays instead of :class:`MeshCell` objs,
+        and does not verify the longitude is less than or equal :code:`MeshCoord(80, 0, 0)`.
+
+        Args:
+            latitudes: the latitudes [deg] which satisfy 0.0 <= and <= 66.666...
+            longitudes: the longitudes [deg] which satisfy 100.0 <= and <= 180.0
+            mesh_unit: the mesh unit, :obj:`1` or :obj:`5`
+
+        Returns:
+            a :obj:`dict` which maps the corner (:obj:`'south_west'`, :obj:`'south_east'`,
+            :obj:`'north_west'` and :obj:`'north_east'`) to a sextuplet of
+            the latitude digits and the longitude digits (:obj:`numpy.int8` arrays)
+
+        Raises:
+            ValueError: if any element of `latitudes` or `longitudes` is out-of-range
+            OverflowError: if any north/east neighbour overflows :code:`MeshCoord(99, 7, 9)`
+
+        See Also:
+            - :meth:`MeshCell.from_pos`
+            - :meth:`MeshNode.from_pos_array`
+        """
+        lat = MeshCoord.from_latitudes(latitudes, mesh_unit=mesh_unit)
+        lng = MeshCoord.from_longitudes(longitudes, mesh_unit=mesh_unit)
+
+        next_lat = _next_up_array(*lat, mesh_unit=mesh_unit)
+        next_lng = _next_up_array(*lng, mesh_unit=mesh_unit)
+
+        return {
+            "south_west": lat + lng,
+            "south_east": lat + next_lng,
+            "north_west": next_lat + lng,
+            "north_east": next_lat + next_lng,
+        }
+
     def position(self, latitude: float, longitude: float) -> tuple[float, float]:
         """Return the position in the cell.
 
@@ -984,14 +1364,51 @@ class MeshCell:
             >>> cell.position(lat, lng)
             (0.4905949600000099, 0.405680656000186)
         """
-        # The cell stretches 1.5 times in the latitude direction
-        # compared to the longitude direction,
-        # then here uses 120 = 1.5 * 80.
-        lat = latitude - self.south_west.latitude.to_latitude()
-        lng = longitude - self.south_west.longitude.to_longitude()
-        if self.mesh_unit == 1:
-            return 120 * lat, 80 * lng
-        return 24 * lat, 16 * lng
+        return (
+            self._k_latitude * (latitude - self._sw_latitude),
+            self._k_longitude * (longitude - self._sw_longitude),
+        )
+
+    def position_bulk(self, latitudes, longitudes, dtype=None):
+        """Return the positions in the cell of each point (requires :mod:`numpy`).
+
+        This is a bulk variant of :meth:`MeshCell.position`,
+        evaluating the origin and the scales only once for the whole input.
+
+        Args:
+            latitudes: the latitudes of the points (array-like)
+            longitudes: the longitudes of the points (array-like)
+            dtype: the dtype of the result, defaulting :obj:`numpy.float64`;
+                :obj:`numpy.float32` halves memory traffic with absolute error
+                up to ~1e-7 of the input coordinate (roughly 1e-3 of the cell span,
+                since the subtraction cancels), acceptable for coarse queries only
+
+        Returns:
+            the positions, a pair of the latitude and the longitude arrays of `dtype`
+
+        Raises:
+            ImportError: when numpy is not installed
+
+        Examples:
+            >>> lat, lng = 36.10377479, 140.087855041
+            >>> cell = MeshCell.from_pos(lat, lng, mesh_unit=1)
+            >>> cell.position_bulk([lat], [lng])
+            (array([0.4529748]), array([0.02840328]))
+
+        See Also:
+            - :meth:`MeshCell.position`
+        """
+        if _np is None:
+            raise ImportError("position_bulk requires numpy, consider installing 'jgdtrans[numpy]'")
+
+        if dtype is None:
+            dtype = _np.float64
+        latitudes = _np.ascontiguousarray(latitudes, dtype=dtype)
+        longitudes = _np.ascontiguousarray(longitudes, dtype=dtype)
+        return (
+            self._k_latitude * (latitudes - self._sw_latitude),
+            self._k_longitude * (longitudes - self._sw_longitude),
+        )
 
 
 MESH_COORD_MIN: Final[MeshCoord] = MeshCoord(0, 0, 0)
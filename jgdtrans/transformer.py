@@ -21,6 +21,11 @@ from . import mesh as _mesh
 from . import par as _par
 from . import point as _point
 
+try:
+    import numpy as _np
+except ImportError:  # no cov
+    _np = None  # type: ignore[assignment]
+
 __all__ = [
     "Transformer",
     "Correction",
@@ -574,6 +579,268 @@ class Transformer:
             altitude=altitude + corr.altitude,
         )
 
+    def transform_bulk(self, latitudes, longitudes, altitudes=0.0, backward: bool = False):
+        """Returns the transformed positions (requires :mod:`numpy`).
+
+        This is a bulk variant of :meth:`Transformer.transform`.
+        Both directions resolve the cells, gather the corner parameters and
+        evaluate the interpolation with array math,
+        producing the same values as point-by-point calls.
+
+        Args:
+            latitudes: the latitudes [deg] of the points (array-like)
+            longitudes: the longitudes [deg] of the points (array-like)
+            altitudes: the altitudes [m] of the points (array-like or scalar)
+            backward: when :obj:`True`, this performs backward transformation
+
+        Returns:
+            the transformed points, a triple of the latitude, the longitude
+            and the altitude :obj:`numpy.float64` arrays
+
+        Raises:
+            ParameterNotFoundError: when any point points to an area
+                                    where the parameter does not support
+            CorrectionNotFoundError: when `backward` and verification failed on any point
+            PointOutOfBoundsError: when any latitude or longitude is out-of-bounds
+            ImportError: when numpy is not installed
+
+        Examples:
+            From `SemiDynaEXE2023.par`
+
+            >>> tf.transform_bulk([36.10377479], [140.087855041], 2.34)
+            (array([36.10377302]), array([140.08785924]), array([2.43631386]))
+
+        See Also:
+            - :meth:`Transformer.transform`
+        """
+        if _np is None:
+            raise ImportError("transform_bulk requires numpy, consider installing 'jgdtrans[numpy]'")
+
+        latitudes = _np.ascontiguousarray(latitudes, dtype=_np.float64)
+        longitudes = _np.ascontiguousarray(longitudes, dtype=_np.float64)
+
+        if backward:
+            lat_corr, lng_corr, alt_corr = self.backward_corr_bulk(latitudes, longitudes)
+        else:
+            lat_corr, lng_corr, alt_corr = self.forward_corr_bulk(latitudes, longitudes)
+        return (
+            latitudes + lat_corr,
+            longitudes + lng_corr,
+            _np.asarray(altitudes, dtype=_np.float64) + alt_corr,
+        )
+
+    def forward_corr_bulk(self, latitudes, longitudes):
+        """Return the corrections on forward-transformation of every point (requires :mod:`numpy`).
+
+        This is a bulk variant of :meth:`Transformer.forward_corr`;
+        it performs no Python-level work per point.
+
+        Args:
+            latitudes: the latitudes [deg] of the points (array-like)
+            longitudes: the longitudes [deg] of the points (array-like)
+
+        Returns:
+            the corrections, a triple of the latitude [deg], the longitude [deg]
+            and the altitude [m] :obj:`numpy.float64` arrays
+
+        Raises:
+            ParameterNotFoundError: when any point points to an area
+                                    where the parameter does not support
+            PointOutOfBoundsError: when any latitude or longitude is out-of-bounds
+            ImportError: when numpy is not installed
+
+        See Also:
+            - :meth:`Transformer.forward_corr`
+        """
+        if _np is None:
+            raise ImportError("forward_corr_bulk requires numpy, consider installing 'jgdtrans[numpy]'")
+
+        mesh_unit = self.data.mesh_unit()
+        latitudes = _np.ascontiguousarray(latitudes, dtype=_np.float64)
+        longitudes = _np.ascontiguousarray(longitudes, dtype=_np.float64)
+
+        # resolving cells
+        try:
+            cell = _mesh.MeshCell.from_pos_array(latitudes, longitudes, mesh_unit=mesh_unit)
+        except ValueError as e:
+            raise _error.PointOutOfBoundsError from e
+
+        # finding parameters
+        sw = self._parameter_arrays(cell["south_west"], "sw")
+        se = self._parameter_arrays(cell["south_east"], "se")
+        nw = self._parameter_arrays(cell["north_west"], "nw")
+        ne = self._parameter_arrays(cell["north_east"], "ne")
+
+        # the position in the cells, as MeshCell.position does
+        lat_first, lat_second, lat_third, lng_first, lng_second, lng_third = (
+            digits.astype(_np.float64) for digits in cell["south_west"]
+        )
+        sw_latitude = 2 * (lat_first + lat_second / 8 + lat_third / 80) / 3
+        sw_longitude = 100 + (lng_first + lng_second / 8 + lng_third / 80)
+        k_latitude, k_longitude = (120, 80) if mesh_unit == 1 else (24, 16)
+        y = k_latitude * (latitudes - sw_latitude)
+        x = k_longitude * (longitudes - sw_longitude)
+
+        # bilinear interpolation, in the very order of bilinear_interpolation()
+        def interpolate(i: int):
+            return (
+                sw[i] * (1 - x) * (1 - y) + se[i] * x * (1 - y) + nw[i] * (1 - x) * y + ne[i] * x * y
+            )
+
+        # Make the unit of lat and lng [deg] from [sec]
+        # by diving by the scale, 3600.
+        scale: Final = 3600
+
+        return interpolate(0) / scale, interpolate(1) / scale, interpolate(2)
+
+    def backward_corr_bulk(self, latitudes, longitudes):
+        """Return the corrections on backward-transformation of every point (requires :mod:`numpy`).
+
+        This is a bulk variant of :meth:`Transformer.backward_corr`.
+        The Newton iteration runs on whole arrays with a shrinking set of
+        unconverged points; each point produces the same value as the
+        point-by-point call, since every step mirrors the scalar arithmetic.
+
+        Args:
+            latitudes: the latitudes [deg] of the points (array-like)
+            longitudes: the longitudes [deg] of the points (array-like)
+
+        Returns:
+            the corrections, a triple of the latitude [deg], the longitude [deg]
+            and the altitude [m] :obj:`numpy.float64` arrays
+
+        Raises:
+            ParameterNotFoundError: when any point points to an area
+                                    where the parameter does not support
+            CorrectionNotFoundError: when verification failed on any point
+            PointOutOfBoundsError: when any latitude or longitude is out-of-bounds
+            ImportError: when numpy is not installed
+
+        See Also:
+            - :meth:`Transformer.backward_corr`
+        """
+        if _np is None:
+            raise ImportError("backward_corr_bulk requires numpy, consider installing 'jgdtrans[numpy]'")
+
+        # see backward_corr for the rationale of the iteration count
+        iteration: Final = 4
+
+        # for [sec] to [deg]
+        scale: Final = 3600
+
+        mesh_unit = self.data.mesh_unit()
+        k_latitude, k_longitude = (120, 80) if mesh_unit == 1 else (24, 16)
+
+        latitude = _np.ascontiguousarray(latitudes, dtype=_np.float64)
+        longitude = _np.ascontiguousarray(longitudes, dtype=_np.float64)
+
+        # Xn
+        xn = longitude.copy()
+        yn = latitude.copy()
+
+        lat_corr = _np.empty_like(latitude)
+        lng_corr = _np.empty_like(latitude)
+        alt_corr = _np.empty_like(latitude)
+
+        # the indices of the unconverged points
+        active = _np.arange(latitude.size)
+        if not active.size:
+            return lat_corr, lng_corr, alt_corr
+
+        for _ in range(iteration):
+            ylat = yn[active]
+            xlng = xn[active]
+
+            try:
+                cell = _mesh.MeshCell.from_pos_array(ylat, xlng, mesh_unit=mesh_unit)
+            except ValueError as e:
+                raise _error.PointOutOfBoundsError from e
+
+            sw = self._parameter_arrays(cell["south_west"], "sw")
+            se = self._parameter_arrays(cell["south_east"], "se")
+            nw = self._parameter_arrays(cell["north_west"], "nw")
+            ne = self._parameter_arrays(cell["north_east"], "ne")
+
+            # the position in the cells, as MeshCell.position does
+            lat_first, lat_second, lat_third, lng_first, lng_second, lng_third = (
+                digits.astype(_np.float64) for digits in cell["south_west"]
+            )
+            sw_latitude = 2 * (lat_first + lat_second / 8 + lat_third / 80) / 3
+            sw_longitude = 100 + (lng_first + lng_second / 8 + lng_third / 80)
+            y = k_latitude * (ylat - sw_latitude)
+            x = k_longitude * (xlng - sw_longitude)
+
+            # in the very order of backward_corr
+            corr_x = (sw[1] * (1 - x) * (1 - y) + se[1] * x * (1 - y) + nw[1] * (1 - x) * y + ne[1] * x * y) / scale
+            corr_y = (sw[0] * (1 - x) * (1 - y) + se[0] * x * (1 - y) + nw[0] * (1 - x) * y + ne[0] * x * y) / scale
+
+            # f(x, y) of the newton method
+            fx = longitude[active] - (xlng + corr_x)
+            fy = latitude[active] - (ylat + corr_y)
+
+            # which Jacobian (on the raw coordinates, as backward_corr does)
+            fx_x = -1 - ((se[1] - sw[1]) * (1 - ylat) + (ne[1] - nw[1]) * ylat) / scale
+            fx_y = -((nw[1] - sw[1]) * (1 - xlng) + (ne[1] - se[1]) * xlng) / scale
+            fy_x = -((se[0] - sw[0]) * (1 - ylat) + (ne[0] - nw[0]) * ylat) / scale
+            fy_y = -1 - ((nw[0] - sw[0]) * (1 - xlng) + (ne[0] - se[0]) * xlng) / scale
+
+            # and its determinant
+            det = fx_x * fy_y - fx_y * fy_x
+
+            # update Xn
+            xlng = xlng - (fy_y * fx - fx_y * fy) / det
+            ylat = ylat - (fx_x * fy - fy_x * fx) / det
+            xn[active] = xlng
+            yn[active] = ylat
+
+            # verify
+            c_lat, c_lng, c_alt = self.forward_corr_bulk(ylat, xlng)
+            converged = (_np.abs(latitude[active] - (ylat + c_lat)) < self.MAX_ERROR) & (
+                _np.abs(longitude[active] - (xlng + c_lng)) < self.MAX_ERROR
+            )
+
+            done = active[converged]
+            lat_corr[done] = -c_lat[converged]
+            lng_corr[done] = -c_lng[converged]
+            alt_corr[done] = -c_alt[converged]
+
+            active = active[~converged]
+            if not active.size:
+                return lat_corr, lng_corr, alt_corr
+
+        i = active[0]
+        raise _error.CorrectionNotFoundError(
+            f"exhaust {iteration} iterations but error is still high, "
+            f"we finally got {yn[i]} and {xn[i]} from {latitude[i]} and {longitude[i]}"
+        ) from None
+
+    def _parameter_arrays(self, digits, corner: str):
+        """Gathers the parameter triple of every node as three arrays.
+
+        `digits` is the 6-tuple of digit arrays identifying the nodes,
+        see :meth:`.MeshNode.from_pos_array`.
+
+        Raises:
+            ParameterNotFoundError: when the parameter of any node is missing
+        """
+        meshcodes = _mesh.MeshNode.to_meshcodes(*digits)
+
+        data = self.data
+        if isinstance(data, _par.ParameterTable):
+            if len(data.mesh_code) == 0 and meshcodes.size:
+                raise _error.ParameterNotFoundError(corner) from None
+            i = _np.searchsorted(data.mesh_code, meshcodes)
+            i = _np.minimum(i, len(data.mesh_code) - 1)
+            if not (data.mesh_code[i] == meshcodes).all():
+                raise _error.ParameterNotFoundError(corner) from None
+            return data.latitude[i], data.longitude[i], data.altitude[i]
+
+        parameters = tuple(map(data.get, meshcodes.tolist()))
+        if None in parameters:
+            raise _error.ParameterNotFoundError(corner) from None
+        values = _np.array(parameters, dtype=_np.float64).reshape(-1, 3)
+        return values[:, 0], values[:, 1], values[:, 2]
+
     def _parameter_quadruple(
         self,
         cell: _mesh.MeshCell,
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import copy
+import pickle
 import unittest
+from itertools import product
 
 from jgdtrans import dms
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestDMS(unittest.TestCase):
+    def test_pickle(self):
+        obj = dms.DMS(1, 36, 6, 13, 0.58925)
+        self.assertEqual(obj, pickle.loads(pickle.dumps(obj)))
+        self.assertEqual(obj, copy.deepcopy(obj))
+
     def test_to_str(self):
         cases = (
             ("0.0", dms.DMS(1, 0, 0, 0, 0.0).to_str()),
@@ -108,61 +121,104 @@ class TestDMS(unittest.TestCase):
         self.assertEqual(expected, actual)
 
     def test_identity_1(self):
-        for deg in range(45):
-            for min in range(60):
-                for sec in range(60):
-                    # plus
-                    origin = dms.DMS(1, deg, min, sec, 0).to_dd()
-                    z = dms.DMS.from_dd(origin)
-                    self.assertLess(abs(z.to_dd() - origin), 3e-15)
-
-                    # minus
-                    origin = dms.DMS(-1, deg, min, sec, 0).to_dd()
-                    z = dms.DMS.from_dd(origin)
-                    self.assertLess(abs(z.to_dd() - origin), 3e-15)
+        for deg, min, sec in product(range(45), range(60), range(60)):
+            # plus
+            origin = dms.DMS(1, deg, min, sec, 0).to_dd()
+            z = dms.DMS.from_dd(origin)
+            self.assertLess(abs(z.to_dd() - origin), 3e-15)
 
-    def test_identity_2(self):
-        for deg in range(45, 90):
-            for min in range(60):
-                for sec in range(60):
+            # minus
+            origin = dms.DMS(-1, deg, min, sec, 0).to_dd()
+            z = dms.DMS.from_dd(origin)
+            self.assertLess(abs(z.to_dd() - origin), 3e-15)
 
-                    # plus
-                    origin = dms.DMS(1, deg, min, sec, 0).to_dd()
-                    z = dms.DMS.from_dd(origin)
-                    self.assertLess(abs(z.to_dd() - origin), 3e-15)
+    def test_identity_2(self):
+        for deg, min, sec in product(range(45, 90), range(60), range(60)):
+            # plus
+            origin = dms.DMS(1, deg, min, sec, 0).to_dd()
+            z = dms.DMS.from_dd(origin)
+            self.assertLess(abs(z.to_dd() - origin), 3e-15)
 
-                    # minus
-                    origin = dms.DMS(-1, deg, min, sec, 0).to_dd()
-                    z = dms.DMS.from_dd(origin)
-                    self.assertLess(abs(z.to_dd() - origin), 3e-15)
+            # minus
+            origin = dms.DMS(-1, deg, min, sec, 0).to_dd()
+            z = dms.DMS.from_dd(origin)
+            self.assertLess(abs(z.to_dd() - origin), 3e-15)
 
     def test_identity_3(self):
-        for deg in range(90, 135):
-            for min in range(60):
-                for sec in range(60):
-                    # plus
-                    origin = dms.DMS(1, deg, min, sec, 0).to_dd()
-                    z = dms.DMS.from_dd(origin)
-                    self.assertLess(abs(z.to_dd() - origin), 3e-15)
-
-                    # minus
-                    origin = dms.DMS(-1, deg, min, sec, 0).to_dd()
-                    z = dms.DMS.from_dd(origin)
-                    self.assertLess(abs(z.to_dd() - origin), 3e-15)
+        for deg, min, sec in product(range(90, 135), range(60), range(60)):
+            # plus
+            origin = dms.DMS(1, deg, min, sec, 0).to_dd()
+            z = dms.DMS.from_dd(origin)
+            self.assertLess(abs(z.to_dd() - origin), 3e-15)
+
+            # minus
+            origin = dms.DMS(-1, deg, min, sec, 0).to_dd()
+            z = dms.DMS.from_dd(origin)
+            self.assertLess(abs(z.to_dd() - origin), 3e-15)
 
     def test_identity_4(self):
-        for deg in range(135, 180):
-            for min in range(60):
-                for sec in range(60):
-                    # plus
-                    origin = dms.DMS(1, deg, min, sec, 0).to_dd()
-                    z = dms.DMS.from_dd(origin)
-                    self.assertLess(abs(z.to_dd() - origin), 3e-15)
-
-                    # minus
-                    origin = dms.DMS(-1, deg, min, sec, 0).to_dd()
-                    z = dms.DMS.from_dd(origin)
-                    self.assertLess(abs(z.to_dd() - origin), 3e-15)
+        for deg, min, sec in product(range(135, 180), range(60), range(60)):
+            # plus
+            origin = dms.DMS(1, deg, min, sec, 0).to_dd()
+            z = dms.DMS.from_dd(origin)
+            self.assertLess(abs(z.to_dd() - origin), 3e-15)
+
+            # minus
+            origin = dms.DMS(-1, deg, min, sec, 0).to_dd()
+            z = dms.DMS.from_dd(origin)
+            self.assertLess(abs(z.to_dd() - origin), 3e-15)
+
+
+@unittest.skipUnless(np is not None, "requires numpy")
+class TestBulk(unittest.TestCase):
+    def test_from_dd(self):
+        """Identical to element-wise DMS.from_dd"""
+        ts = (0.0, -0.0, 36.103774791666666, -36.103774791666666, 140.08785504166667, 179.99999999999, 180.0, -180.0)
+
+        sign, degree, minute, second, fract = dms.from_dd_bulk(ts)
+        for i, t in enumerate(ts):
+            with self.subTest(t=t):
+                expected = dms.DMS.from_dd(t)
+                actual = dms.DMS(int(sign[i]), int(degree[i]), int(minute[i]), int(second[i]), float(fract[i]))
+                self.assertEqual(expected, actual)
+
+    def test_to_dd(self):
+        """Identical to element-wise DMS.to_dd"""
+        objs = (
+            dms.DMS(1, 0, 0, 0, 0.0),
+            dms.DMS(-1, 0, 0, 0, 0.0),
+            dms.DMS(1, 36, 6, 13, 0.58925),
+            dms.DMS(-1, 36, 6, 13, 0.58925),
+            dms.DMS(1, 140, 5, 16, 0.27815),
+            dms.DMS(1, 180, 0, 0, 0.0),
+        )
+
+        actual = dms.to_dd_bulk(
+            tuple(o.sign for o in objs),
+            tuple(o.degree for o in objs),
+            tuple(o.minute for o in objs),
+            tuple(o.second for o in objs),
+            tuple(o.fract for o in objs),
+        )
+        self.assertEqual([o.to_dd() for o in objs], actual.tolist())
+
+    def test_identity(self):
+        """Sampled counterpart of TestDMS.test_identity_*"""
+        degrees = np.repeat((0, 36, 89, 140, 179), 60)
+        minutes = np.tile(np.arange(60), 5)
+        seconds = np.full_like(degrees, 30)
+
+        for s in (1, -1):
+            with self.subTest(sign=s):
+                origin = dms.to_dd_bulk(np.full_like(degrees, s), degrees, minutes, seconds, 0.0)
+                z = dms.to_dd_bulk(*dms.from_dd_bulk(origin))
+                self.assertLess(np.abs(z - origin).max(), 3e-15)
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            dms.from_dd_bulk([0.0, 180.1])
+        with self.assertRaises(ValueError):
+            dms.from_dd_bulk([-181.0])
 
 
 class TestToFromDMS(unittest.TestCase):
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import copy
+import pickle
 import unittest
 
 from jgdtrans import Point, mesh
 from jgdtrans.mesh import MeshCell, MeshCoord, MeshNode, is_meshcode
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestIsMeshcode(unittest.TestCase):
     def test(self):
@@ -32,6 +39,34 @@ class TestMeshCoord(unittest.TestCase):
         with self.assertRaises(ValueError):
             MeshCoord(0, 0, 10)
 
+    def test_pickle(self):
+        coord = MeshCoord(54, 1, 2)
+        self.assertEqual(coord, pickle.loads(pickle.dumps(coord)))
+        self.assertEqual(coord, copy.deepcopy(coord))
+
+        # with the lazily-filled caches
+        coord = MeshCoord.from_latitude(36.103774791666666, 1)
+        coord.to_latitude()
+        restored = pickle.loads(pickle.dumps(coord))
+        self.assertEqual(coord, restored)
+        self.assertEqual(coord.to_latitude(), restored.to_latitude())
+
+    @unittest.skipUnless(np is not None, "requires numpy")
+    def test_init_numpy_digits(self):
+        """Constructing with numpy digits must not disturb interned instances"""
+        interned = MeshCoord.from_latitude(36.103774791666666, 1)
+        self.assertEqual(MeshCoord(54, 1, 2), interned)
+
+        coord = MeshCoord(np.int8(54), np.int8(1), np.int8(2))
+        self.assertEqual(MeshCoord(54, 1, 2), coord)
+        # the comparison key must not overflow the narrow digit type
+        self.assertTrue(coord < MeshCoord(54, 1, 3))
+        self.assertTrue(MeshCoord(54, 1, 1) < coord)
+
+        # the interned obj is intact
+        self.assertIsInstance(interned.first, int)
+        self.assertTrue(interned < MeshCoord(54, 1, 3))
+
     def test_le_lt(self):
         node = MeshCoord(10, 0, 0)
         other = MeshCoord(0, 0, 0)
@@ -261,6 +296,13 @@ class TestMeshNode(unittest.TestCase):
         with self.assertRaises(ValueError):
             MeshNode(MeshCoord(0, 0, 0), coord)
 
+    def test_pickle(self):
+        node = MeshNode.from_meshcode(54401027)
+        restored = pickle.loads(pickle.dumps(node))
+        self.assertEqual(node, restored)
+        self.assertEqual(node.to_meshcode(), restored.to_meshcode())
+        self.assertEqual(node, copy.deepcopy(node))
+
     def test_is_unit(self):
         node = MeshNode.from_meshcode(54401027)
         self.assertTrue(node.is_mesh_unit(1))
@@ -425,6 +467,13 @@ class TestMeshCell(unittest.TestCase):
                 mesh_unit=5,
             )
 
+    def test_pickle(self):
+        cell = MeshCell.from_meshcode(54401027, mesh_unit=1)
+        restored = pickle.loads(pickle.dumps(cell))
+        self.assertEqual(cell, restored)
+        self.assertEqual(cell.position(36.10377479, 140.087855041), restored.position(36.10377479, 140.087855041))
+        self.assertEqual(cell, copy.deepcopy(cell))
+
     def test_from_code(self):
         actual = MeshCell.from_meshcode(54401027, mesh_unit=1)
         expected = MeshCell(
@@ -547,6 +596,161 @@ class TestMeshCell(unittest.TestCase):
         expected = (0.4905949600000099, 0.405680656000186)
         self.assertEqual(expected, actual)
 
+    @unittest.skipUnless(np is not None, "requires numpy")
+    def test_position_bulk(self):
+        lat, lng = 36.10377479, 140.087855041
+
+        for mesh_unit in (1, 5):
+            with self.subTest(mesh_unit=mesh_unit):
+                cell = MeshCell.from_pos(lat, lng, mesh_unit=mesh_unit)
+
+                lats, lngs = cell.position_bulk([lat, lat], [lng, lng])
+                expected = cell.position(lat, lng)
+                self.assertEqual([expected[0]] * 2, lats.tolist())
+                self.assertEqual([expected[1]] * 2, lngs.tolist())
+
+    @unittest.skipUnless(np is not None, "requires numpy")
+    def test_position_bulk_float32(self):
+        lat, lng = 36.10377479, 140.087855041
+        cell = MeshCell.from_pos(lat, lng, mesh_unit=1)
+
+        lats, lngs = cell.position_bulk([lat], [lng], dtype=np.float32)
+        expected = cell.position(lat, lng)
+        self.assertEqual(np.float32, lats.dtype)
+        self.assertEqual(np.float32, lngs.dtype)
+        # the subtraction cancels against the ~100 deg coordinate,
+        # hence ~1e-3 of the cell span is lost in float32
+        self.assertAlmostEqual(expected[0], float(lats[0]), places=2)
+        self.assertAlmostEqual(expected[1], float(lngs[0]), places=2)
+
+
+@unittest.skipUnless(np is not None, "requires numpy")
+class TestMeshCoordBatch(unittest.TestCase):
+    def test_from_latitudes(self):
+        degrees = [0.0, 36.103774791666666, 36.1, 66.6, 0.1, 59.999]
+
+        for mesh_unit in (1, 5):
+            with self.subTest(mesh_unit=mesh_unit):
+                firsts, seconds, thirds = MeshCoord.from_latitudes(np.asarray(degrees), mesh_unit)
+                for degree, first, second, third in zip(degrees, firsts, seconds, thirds):
+                    expected = MeshCoord.from_latitude(degree, mesh_unit)
+                    self.assertEqual(expected, MeshCoord(int(first), int(second), int(third)))
+
+        with self.assertRaises(ValueError):
+            MeshCoord.from_latitudes(np.asarray([0.0, -1.0]), 1)
+        with self.assertRaises(ValueError):
+            MeshCoord.from_latitudes(np.asarray([0.0, np.nan]), 1)
+
+        with self.assertRaises(TypeError):
+            MeshCoord.from_latitudes(np.asarray([0.0]), 2)
+
+    def test_from_longitudes(self):
+        degrees = [100.0, 140.08785504166664, 140.0875, 180.0, 123.456]
+
+        for mesh_unit in (1, 5):
+            with self.subTest(mesh_unit=mesh_unit):
+                firsts, seconds, thirds = MeshCoord.from_longitudes(np.asarray(degrees), mesh_unit)
+                for degree, first, second, third in zip(degrees, firsts, seconds, thirds):
+                    expected = MeshCoord.from_longitude(degree, mesh_unit)
+                    self.assertEqual(expected, MeshCoord(int(first), int(second), int(third)))
+
+        with self.assertRaises(ValueError):
+            MeshCoord.from_longitudes(np.asarray([100.0, 99.9]), 1)
+        with self.assertRaises(ValueError):
+            MeshCoord.from_longitudes(np.asarray([100.0, np.nan]), 1)
+
+        with self.assertRaises(TypeError):
+            MeshCoord.from_longitudes(np.asarray([100.0]), 2)
+
+    def test_from_pos_array(self):
+        lats = np.asarray([36.10377479, 36.0, 35.5])
+        lngs = np.asarray([140.087855041, 140.0, 135.5])
+
+        for mesh_unit in (1, 5):
+            with self.subTest(mesh_unit=mesh_unit):
+                actual = MeshCell.from_pos_array(lats, lngs, mesh_unit=mesh_unit)
+                for i, (lat, lng) in enumerate(zip(lats, lngs)):
+                    expected = MeshCell.from_pos(float(lat), float(lng), mesh_unit=mesh_unit)
+                    for corner, node in (
+                        ("south_west", expected.south_west),
+                        ("south_east", expected.south_east),
+                        ("north_west", expected.north_west),
+                        ("north_east", expected.north_east),
+                    ):
+                        digits = tuple(int(arr[i]) for arr in actual[corner])
+                        self.assertEqual(
+                            (
+                                node.latitude.first,
+                                node.latitude.second,
+                                node.latitude.third,
+                                node.longitude.first,
+                                node.longitude.second,
+                                node.longitude.third,
+                            ),
+                            digits,
+                        )
+
+                node_actual = MeshNode.from_pos_array(lats, lngs, mesh_unit=mesh_unit)
+                for i, (lat, lng) in enumerate(zip(lats, lngs)):
+                    node = MeshNode.from_pos(float(lat), float(lng), mesh_unit=mesh_unit)
+                    digits = tuple(int(arr[i]) for arr in node_actual)
+                    self.assertEqual(
+                        (
+                            node.latitude.first,
+                            node.latitude.second,
+                            node.latitude.third,
+                            node.longitude.first,
+                            node.longitude.second,
+                            node.longitude.third,
+                        ),
+                        digits,
+                    )
+
+    def test_meshcodes(self):
+        meshcodes = [54401027, 54401005, 0, 99807090]
+
+        digits = MeshNode.from_meshcodes(np.asarray(meshcodes))
+        for i, meshcode in enumerate(meshcodes):
+            node = MeshNode.from_meshcode(meshcode)
+            self.assertEqual(
+                (
+                    node.latitude.first,
+                    node.latitude.second,
+                    node.latitude.third,
+                    node.longitude.first,
+                    node.longitude.second,
+                    node.longitude.third,
+                ),
+                tuple(int(arr[i]) for arr in digits),
+            )
+
+        # roundtrip
+        actual = MeshNode.to_meshcodes(*digits)
+        self.assertEqual(meshcodes, actual.tolist())
+
+        with self.assertRaises(ValueError):
+            MeshNode.from_meshcodes(np.asarray([-1]))
+        with self.assertRaises(ValueError):
+            MeshNode.from_meshcodes(np.asarray([100000000]))
+        with self.assertRaises(ValueError):
+            MeshNode.from_meshcodes(np.asarray([10810000]))
+        with self.assertRaises(ValueError):
+            MeshNode.from_meshcodes(np.asarray([10100800]))
+
+    def test_identity(self):
+        # MeshCoord.from_latitudes vs MeshCoord.from_latitude on dense samples
+        degrees = np.linspace(0.0, 66.6, 10_000)
+        firsts, seconds, thirds = MeshCoord.from_latitudes(degrees, 1)
+        for degree, first, second, third in zip(degrees, firsts, seconds, thirds):
+            expected = MeshCoord.from_latitude(float(degree), 1)
+            self.assertEqual(expected, MeshCoord(int(first), int(second), int(third)))
+
+        degrees = np.linspace(100.0, 180.0, 10_000)
+        firsts, seconds, thirds = MeshCoord.from_longitudes(degrees, 1)
+        for degree, first, second, third in zip(degrees, firsts, seconds, thirds):
+            expected = MeshCoord.from_longitude(float(degree), 1)
+            self.assertEqual(expected, MeshCoord(int(first), int(second), int(third)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import dataclasses
 import math
+import os
+import pickle
+import tempfile
 import unittest
 
 import jgdtrans
 from jgdtrans import ParData, Parameter
 from jgdtrans.par import is_format, StatisticData
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 DATA = {
     "TKY2JGD": {
         "format": "TKY2JGD",
@@ -244,6 +253,11 @@ class TestParData(unittest.TestCase):
             stats.horizontal,
         )
 
+    def test_statistics_pickle(self):
+        stats = ParData.from_dict(DATA["SemiDynaEXE"]).statistics()
+        self.assertEqual(stats.latitude, pickle.loads(pickle.dumps(stats.latitude)))
+        self.assertEqual(stats, pickle.loads(pickle.dumps(stats)))
+
 
 class TestError(unittest.TestCase):
     def test_short_text(self):
@@ -695,5 +709,242 @@ class TestITRF2014(unittest.TestCase):
         self.assertEqual(expected, actual)
 
 
+@unittest.skipUnless(np is not None, "requires numpy")
+class TestParameterTable(unittest.TestCase):
+    def test_get(self):
+        data = ParData.from_dict(DATA["SemiDynaEXE"])
+        table = jgdtrans.par.ParameterTable.from_par_data(data)
+
+        self.assertEqual(len(data.parameter), len(table))
+        for meshcode, parameter in data.parameter.items():
+            self.assertEqual(parameter, table.get(meshcode))
+            self.assertEqual(parameter, table[meshcode])
+
+        self.assertIsNone(table.get(10000000))
+        self.assertIsNone(table.get(99999999))
+        with self.assertRaises(KeyError):
+            table[10000000]
+
+    def test_mesh_unit(self):
+        data = ParData.from_dict(DATA["SemiDynaEXE"])
+        table = jgdtrans.par.ParameterTable.from_par_data(data)
+        self.assertEqual(5, table.mesh_unit())
+
+    def test_transformer(self):
+        data = ParData.from_dict(DATA["SemiDynaEXE"])
+        table = jgdtrans.par.ParameterTable.from_par_data(data)
+
+        origin = (36.10377479, 140.087855041, 2.34)
+        expected = jgdtrans.Transformer(data=data).forward(*origin)
+        actual = jgdtrans.Transformer(data=table).forward(*origin)
+        self.assertEqual(expected, actual)
+
+    def test_empty(self):
+        data = ParData(format="SemiDynaEXE", parameter={})
+        table = jgdtrans.par.ParameterTable.from_par_data(data)
+        self.assertEqual(0, len(table))
+        self.assertIsNone(table.get(12345678))
+
+    def test_eq(self):
+        data = ParData.from_dict(DATA["SemiDynaEXE"])
+        table = jgdtrans.par.ParameterTable.from_par_data(data)
+        other = jgdtrans.par.ParameterTable.from_par_data(data)
+
+        self.assertEqual(table, other)
+        self.assertNotEqual(table, data)
+
+        # format, description, and each component count
+        self.assertNotEqual(table, dataclasses.replace(other, format="PatchJGD_HV"))
+        self.assertNotEqual(table, dataclasses.replace(other, description="hi!"))
+        self.assertNotEqual(
+            table,
+            jgdtrans.par.ParameterTable.from_par_data(ParData(format="SemiDynaEXE", parameter={})),
+        )
+        self.assertNotEqual(table, dataclasses.replace(other, altitude=other.altitude + 1.0))
+
+
+@unittest.skipUnless(np is not None, "requires numpy")
+class TestBulk(unittest.TestCase):
+    def test_equivalence(self):
+        """The bulk path and the per-line path return identical obj"""
+        texts = {
+            "TKY2JGD": "\n" * 2 + "12345678   0.00001   0.00002\n90123345 -10.00001 -10.00002\n",
+            "PatchJGD": "\n" * 16 + "12345678   0.00001   0.00002\n90123345 -10.00001 -10.00002\n",
+            "PatchJGD_H": "\n" * 16 + "12345678   0.00001 0.00002\n90123345 -10.00001 0.00002\n",
+            "PatchJGD_HV": "\n" * 16 + "12345678   0.00001   0.00002   0.00003\n",
+            "HyokoRev": "\n" * 16 + "12345678      0.00001 0.00002\n90123345    -10.00001 0.00002\n",
+            "SemiDynaEXE": "\n" * 16 + "12345678   0.00001   0.00002   0.00003\n",
+            "geonetF3": "\n" * 18 + "12345678      0.00001   0.00002   0.00003\n",
+            "ITRF2014": "\n" * 18 + "12345678      0.00001   0.00002   0.00003\n",
+        }
+
+        for format, text in texts.items():
+            with self.subTest(format=format):
+                actual = jgdtrans.par.loads(text, format=format)
+
+                origin = jgdtrans.par._np
+                jgdtrans.par._np = None
+                try:
+                    expected = jgdtrans.par.loads(text, format=format)
+                finally:
+                    jgdtrans.par._np = origin
+
+                self.assertEqual(expected, actual)
+
+    def test_splitlines_semantics(self):
+        """The bulk path falls back whenever splitlines() sees different lines"""
+        # a vertical tab splits the line for splitlines() but not for find(b"\n"),
+        # the per-line parser must win
+        text = "\n" * 16 + "12345678\x0b  0.00001   0.00002   0.00003\n"
+        with self.assertRaises(jgdtrans.error.ParseParFileError):
+            jgdtrans.par.loads(text, format="SemiDynaEXE")
+
+        # a multibyte character in a non-captured column
+        # (geonetF3 ignores the columns 8 to 12)
+        # shifts the byte offsets off the character offsets
+        text = "\n" * 18 + "12345678 é   -0.00001   0.00002   0.00003\n"
+        actual = jgdtrans.par.loads(text, format="geonetF3")
+
+        origin = jgdtrans.par._np
+        jgdtrans.par._np = None
+        try:
+            expected = jgdtrans.par.loads(text, format="geonetF3")
+        finally:
+            jgdtrans.par._np = origin
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(-0.00001, actual.parameter[12345678].latitude)
+
+    def test_short_records(self):
+        """Uniformly short records raise, as the per-line path does"""
+        text = "\n" * 16 + "12345678   0.00001   0.00002\n22345678   0.00004   0.00005\n"
+        with self.assertRaises(jgdtrans.error.ParseParFileError):
+            jgdtrans.par.loads(text, format="SemiDynaEXE")
+
+        text = "\n" * 16 + "12345678\n"
+        with self.assertRaises(jgdtrans.error.ParseParFileError):
+            jgdtrans.par.loads(text, format="SemiDynaEXE")
+
+
+class TestLoadPath(unittest.TestCase):
+    def load_path(self, text, format):
+        fd, path = tempfile.mkstemp(suffix=".par")
+        try:
+            with os.fdopen(fd, "w") as fp:
+                fp.write(text)
+            return jgdtrans.par.load_path(path, format=format)
+        finally:
+            os.remove(path)
+
+    def test_equivalence(self):
+        """load_path and loads return identical obj"""
+        texts = {
+            "TKY2JGD": "\n" * 2 + "12345678   0.00001   0.00002\n90123345 -10.00001 -10.00002\n",
+            "SemiDynaEXE": "\n" * 16 + "12345678   0.00001   0.00002   0.00003\n",
+        }
+
+        for format, text in texts.items():
+            with self.subTest(format=format):
+                actual = self.load_path(text, format)
+                expected = jgdtrans.par.loads(text, format=format)
+                self.assertEqual(expected, actual)
+
+    def test_splitlines_semantics(self):
+        """The mmap path falls back whenever splitlines() sees different lines"""
+        text = "\n" * 16 + "12345678\x0b  0.00001   0.00002   0.00003\n"
+        with self.assertRaises(jgdtrans.error.ParseParFileError):
+            self.load_path(text, "SemiDynaEXE")
+
+        text = "\n" * 18 + "12345678 é   -0.00001   0.00002   0.00003\n"
+        actual = self.load_path(text, "geonetF3")
+        expected = jgdtrans.par.loads(text, format="geonetF3")
+        self.assertEqual(expected, actual)
+
+    def test_no_parameter(self):
+        text = "\n" * 16
+        actual = self.load_path(text, "SemiDynaEXE")
+        expected = ParData(format="SemiDynaEXE", description="\n" * 16, parameter={})
+        self.assertEqual(expected, actual)
+
+    def test_short_records(self):
+        """Uniformly short records raise, as the per-line path does"""
+        text = "\n" * 16 + "12345678   0.00001   0.00002\n22345678   0.00004   0.00005\n"
+        with self.assertRaises(jgdtrans.error.ParseParFileError):
+            self.load_path(text, "SemiDynaEXE")
+
+    def test_ragged(self):
+        """Missing EOF newline falls back to loads"""
+        text = "\n" * 16 + "12345678   0.00001   0.00002   0.00003\n12345679   0.00004   0.00005   0.0001"
+        actual = self.load_path(text, "SemiDynaEXE")
+        expected = jgdtrans.par.loads(text, format="SemiDynaEXE")
+        self.assertEqual(expected, actual)
+
+    def test_error(self):
+        with self.assertRaises(jgdtrans.error.ParseParFileError):
+            self.load_path("", "SemiDynaEXE")
+
+
+class TestLoadPaths(unittest.TestCase):
+    def test(self):
+        texts = (
+            "\n" * 16 + "12345678   0.00001   0.00002   0.00003\n",
+            "\n" * 16 + "12345679   0.00004   0.00005   0.00006\n",
+        )
+
+        paths = []
+        try:
+            for text in texts:
+                fd, path = tempfile.mkstemp(suffix=".par")
+                with os.fdopen(fd, "w") as fp:
+                    fp.write(text)
+                paths.append(path)
+
+            actual = jgdtrans.par.load_paths(paths, format="SemiDynaEXE", workers=2)
+            for path, text in zip(paths, texts):
+                self.assertEqual(jgdtrans.par.loads(text, format="SemiDynaEXE"), actual[path])
+        finally:
+            for path in paths:
+                os.remove(path)
+
+    def test_empty(self):
+        self.assertEqual({}, jgdtrans.par.load_paths([], format="SemiDynaEXE"))
+
+
+class TestLoadPathCached(unittest.TestCase):
+    def test(self):
+        text = "\n" * 16 + "12345678   0.00001   0.00002   0.00003\n"
+        expected = jgdtrans.par.loads(text, format="SemiDynaEXE")
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            fd, path = tempfile.mkstemp(suffix=".par")
+            try:
+                with os.fdopen(fd, "w") as fp:
+                    fp.write(text)
+
+                actual = jgdtrans.par.load_path_cached(path, "SemiDynaEXE", cache_dir=cache_dir)
+                self.assertEqual(expected, actual)
+                self.assertEqual(1, len(os.listdir(cache_dir)), msg="cache written")
+
+                actual = jgdtrans.par.load_path_cached(path, "SemiDynaEXE", cache_dir=cache_dir)
+                self.assertEqual(expected, actual, msg="cache hit")
+
+                # rewriting the file invalidates the cache
+                with open(path, "w") as fp:
+                    fp.write("\n" * 16 + "12345679   0.00004   0.00005   0.00006\n")
+                os.utime(path, ns=(0, 0))
+
+                actual = jgdtrans.par.load_path_cached(path, "SemiDynaEXE", cache_dir=cache_dir)
+                self.assertEqual(
+                    jgdtrans.par.ParData(
+                        format="SemiDynaEXE",
+                        description="\n" * 16,
+                        parameter={12345679: Parameter(0.00004, 0.00005, 0.00006)},
+                    ),
+                    actual,
+                )
+            finally:
+                os.remove(path)
+
+
 if __name__ == "__main__":
     unittest.main()
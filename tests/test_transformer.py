@@ -6,10 +6,15 @@ from typing import Sequence
 
 
 from jgdtrans import ParData, Transformer
-from jgdtrans.error import PointOutOfBoundsError
-from jgdtrans.par import StatisticData, Parameter
+from jgdtrans.error import ParameterNotFoundError, PointOutOfBoundsError
+from jgdtrans.par import ParameterTable, StatisticData, Parameter
 from jgdtrans.transformer import bilinear_interpolation
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 DATA = {
     "TKY2JGD": {
         "format": "TKY2JGD",
@@ -155,6 +160,13 @@ class TestFromDict(unittest.TestCase):
 
 
 class TestTransformer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # built once, every test method reads them only
+        cls.tky2jgd = Transformer.from_dict(DATA["TKY2JGD"])
+        cls.patch_jgd_hv = Transformer.from_dict(DATA["PatchJGD(HV)"])
+        cls.semi_dyna_exe = Transformer.from_dict(DATA["SemiDynaEXE"])
+
     def assert_equal_point(self, e: Sequence[float], a: Sequence[float]):
         # [1e-5 m] order
         self.assertAlmostEqual(e[0], a[0], delta=0.00000001)
@@ -173,7 +185,7 @@ class TestTransformer(unittest.TestCase):
 
     def test_vs_web_tky2jgd(self):
         """v.s. original (web)"""
-        trans = Transformer.from_dict(DATA["TKY2JGD"])
+        trans = self.tky2jgd
 
         # 国土地理院
         origin = (36.103774791666666, 140.08785504166664, 0)
@@ -189,7 +201,7 @@ class TestTransformer(unittest.TestCase):
     def test_vs_web_patch_jgd_hv(self):
         """v.s. original (web)"""
         # merged param PatchJGD and PatchJGD(H)
-        trans = Transformer.from_dict(DATA["PatchJGD(HV)"])
+        trans = self.patch_jgd_hv
 
         # 金華山黄金山神社
         origin = (38.2985120586605, 141.5559006163195, 0)
@@ -204,7 +216,7 @@ class TestTransformer(unittest.TestCase):
 
     def test_vs_web_semi_dyna_exe(self):
         """v.s. original (web)"""
-        trans = Transformer.from_dict(DATA["SemiDynaEXE"])
+        trans = self.semi_dyna_exe
 
         # 国土地理院
         origin = (36.103774791666666, 140.08785504166664, 0)
@@ -221,7 +233,7 @@ class TestTransformer(unittest.TestCase):
         """v.s. exact"""
         # the exact value are calculated by `Decimal`
 
-        trans = Transformer.from_dict(DATA["SemiDynaEXE"])
+        trans = self.semi_dyna_exe
 
         # 国土地理院
         origin = (36.103774791666666, 140.08785504166664, 0.0)
@@ -236,7 +248,7 @@ class TestTransformer(unittest.TestCase):
     def test_transform(self):
         """Equivalent test"""
         # TKY2JGD
-        trans = Transformer.from_dict(DATA["TKY2JGD"])
+        trans = self.tky2jgd
 
         # equivalent test 1
         # 国土地理院 with altitude
@@ -263,7 +275,7 @@ class TestTransformer(unittest.TestCase):
         self.assert_equal_point(expected, actual)
 
     def test_forward_corr(self):
-        tf = Transformer.from_dict(DATA["SemiDynaEXE"])
+        tf = self.semi_dyna_exe
 
         with self.assertRaises(PointOutOfBoundsError):
             tf.forward_corr(-1, 0)
@@ -275,7 +287,7 @@ class TestTransformer(unittest.TestCase):
             tf.forward_corr(0, 181)
 
     def test_backward_compat_corr(self):
-        tf = Transformer.from_dict(DATA["SemiDynaEXE"])
+        tf = self.semi_dyna_exe
 
         with self.assertRaises(PointOutOfBoundsError):
             tf.backward_compat_corr(0, 0)
@@ -287,7 +299,7 @@ class TestTransformer(unittest.TestCase):
             tf.backward_compat_corr(0, 181)
 
     def test_backward_corr(self):
-        tf = Transformer.from_dict(DATA["SemiDynaEXE"])
+        tf = self.semi_dyna_exe
 
         with self.assertRaises(PointOutOfBoundsError):
             tf.backward_corr(-1, 0)
@@ -299,5 +311,65 @@ class TestTransformer(unittest.TestCase):
             tf.backward_corr(0, 181)
 
 
+@unittest.skipUnless(np is not None, "requires numpy")
+class TestTransformerBulk(unittest.TestCase):
+    def test_forward(self):
+        """Identical to point-by-point forward()"""
+        tf = Transformer.from_dict(DATA["SemiDynaEXE"])
+        table = Transformer(data=ParameterTable.from_par_data(tf.data))
+
+        origins = [
+            (36.10377479, 140.087855041),
+            (36.103774791666666, 140.08785504166664),
+            (36.10377301875336, 140.08785924400115),
+        ]
+        lats, lngs = zip(*origins)
+
+        expected = [tf.forward(lat, lng, 2.34) for lat, lng in origins]
+        for trans in (tf, table):
+            with self.subTest(data=type(trans.data).__name__):
+                a_lat, a_lng, a_alt = trans.transform_bulk(lats, lngs, 2.34)
+                self.assertEqual([p.latitude for p in expected], a_lat.tolist())
+                self.assertEqual([p.longitude for p in expected], a_lng.tolist())
+                self.assertEqual([p.altitude for p in expected], a_alt.tolist())
+
+    def test_backward(self):
+        """Identical to point-by-point backward()"""
+        tf = Transformer.from_dict(DATA["SemiDynaEXE"])
+        table = Transformer(data=ParameterTable.from_par_data(tf.data))
+
+        origins = [
+            (36.103773017086695, 140.08785924333452),
+            (36.10377301875336, 140.08785924400115),
+            (36.103773019, 140.087859244),
+        ]
+        lats, lngs = zip(*origins)
+
+        expected = [tf.backward(lat, lng, 2.4363138578103) for lat, lng in origins]
+        for trans in (tf, table):
+            with self.subTest(data=type(trans.data).__name__):
+                a_lat, a_lng, a_alt = trans.transform_bulk(lats, lngs, 2.4363138578103, backward=True)
+                self.assertEqual([p.latitude for p in expected], a_lat.tolist())
+                self.assertEqual([p.longitude for p in expected], a_lng.tolist())
+                self.assertEqual([p.altitude for p in expected], a_alt.tolist())
+
+    def test_out_of_bounds(self):
+        tf = Transformer.from_dict(DATA["SemiDynaEXE"])
+
+        with self.assertRaises(PointOutOfBoundsError):
+            tf.transform_bulk([36.10377479, -1.0], [140.087855041, 140.087855041])
+        with self.assertRaises(PointOutOfBoundsError):
+            tf.transform_bulk([36.10377479], [99.0])
+
+    def test_parameter_not_found(self):
+        tf = Transformer.from_dict(DATA["SemiDynaEXE"])
+        table = Transformer(data=ParameterTable.from_par_data(tf.data))
+
+        for trans in (tf, table):
+            with self.subTest(data=type(trans.data).__name__):
+                with self.assertRaises(ParameterNotFoundError):
+                    trans.transform_bulk([35.0], [135.0])
+
+
 if __name__ == "__main__":
     unittest.main()